@@ -28,6 +28,9 @@ MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB limit for file loading
 
 # Text chunking settings
 DEFAULT_MAX_CHUNK_SIZE = 100000  # 100K characters per chunk
+TRANSFORMER_MAX_CHUNK_SIZE = 50000  # Tighter cap for transformer pipelines
+DEFAULT_PIPE_BATCH_SIZE = 8  # Chunks per nlp.pipe batch (chunks are large, keep batches small)
+MIN_CHUNKS_FOR_MULTIPROCESSING = 4  # Fewer chunks than this always run in-process
 
 # Supported transliteration language codes
 SUPPORTED_TRANSLITERATION_CODES = {'sr', 'me', 'mk', 'ru', 'uk', 'kk', 'bg'}
@@ -28,7 +28,6 @@ try:
     from .text_chunker import (
         process_text_in_chunks, 
         split_into_paragraphs, 
-        DEFAULT_MAX_CHUNK_SIZE,
         transliterate_to_latin,
         CYRTRANSLIT_AVAILABLE
     )
@@ -38,7 +37,6 @@ except ImportError:
         from text_chunker import (
             process_text_in_chunks, 
             split_into_paragraphs, 
-            DEFAULT_MAX_CHUNK_SIZE,
             transliterate_to_latin,
             CYRTRANSLIT_AVAILABLE
         )
@@ -50,8 +48,6 @@ except ImportError:
         split_into_paragraphs = None
         transliterate_to_latin = None
         CYRTRANSLIT_AVAILABLE = False
-        # Fallback value matches the default in text_chunker.py
-        DEFAULT_MAX_CHUNK_SIZE = 100000  # 100K characters per chunk
 
 # Import configuration constants
 try:
@@ -569,7 +565,7 @@ class NERDemoGUI:
                 def progress_callback(current, total):
                     progress = 20 + (60 * (current + 1) / total)
                     self.progress_var.set(progress)
-                    self.status_var.set(f"Processing chunk {current+1} of {total}...")
+                    self.status_var.set(f"Processed chunk {current+1} of {total}...")
                     self.root.update()
                 
                 # Get transliteration setting
@@ -580,7 +576,6 @@ class NERDemoGUI:
                     all_entities, html, num_chunks = process_text_in_chunks(
                         self.nlp, 
                         text, 
-                        max_chunk_size=DEFAULT_MAX_CHUNK_SIZE,
                         output_path=output_file,
                         progress_callback=progress_callback,
                         transliterate=use_transliteration,
@@ -598,7 +593,6 @@ class NERDemoGUI:
                     all_entities, html, num_chunks = process_text_in_chunks(
                         self.nlp, 
                         text, 
-                        max_chunk_size=DEFAULT_MAX_CHUNK_SIZE,
                         output_path=output_file,
                         progress_callback=progress_callback,
                         transliterate=False
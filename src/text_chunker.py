@@ -18,17 +18,27 @@ primarily written in Cyrillic script, which is useful when the NER model was
 trained on Latin script.
 """
 
-from typing import List, Optional, Tuple, Callable
+from typing import List, Optional, Tuple, Callable, Iterable, Iterator, TextIO, Union
+import functools
+import os
 import re
 import warnings
-from pathlib import Path
 
 # Try to import config module for constants
 try:
-    from .config import DEFAULT_MAX_CHUNK_SIZE, SUPPORTED_TRANSLITERATION_CODES
+    from .config import (
+        DEFAULT_MAX_CHUNK_SIZE,
+        TRANSFORMER_MAX_CHUNK_SIZE,
+        DEFAULT_PIPE_BATCH_SIZE,
+        MIN_CHUNKS_FOR_MULTIPROCESSING,
+        SUPPORTED_TRANSLITERATION_CODES,
+    )
 except ImportError:
     # Fallback defaults if config not available
     DEFAULT_MAX_CHUNK_SIZE = 100000  # 100K characters per chunk
+    TRANSFORMER_MAX_CHUNK_SIZE = 50000  # Tighter cap for transformer pipelines
+    DEFAULT_PIPE_BATCH_SIZE = 8  # Chunks per nlp.pipe batch
+    MIN_CHUNKS_FOR_MULTIPROCESSING = 4  # Fewer chunks always run in-process
     SUPPORTED_TRANSLITERATION_CODES = {'sr', 'me', 'mk', 'ru', 'uk', 'kk', 'bg'}
 
 # Try to import spacy's displacy for HTML rendering
@@ -48,6 +58,83 @@ except ImportError:
     CYRTRANSLIT_AVAILABLE = False
     cyrtranslit = None
 
+# Blank-line paragraph separator: two newlines with optional whitespace between
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n+')
+
+# Sentence terminator followed by the whitespace run that separates it from
+# the next sentence. Matching the terminator itself (instead of a lookbehind)
+# lets the regex engine skip ahead to candidate characters in a single pass.
+_SENTENCE_END_RE = re.compile(r'[.!?]\s+')
+
+# Q-IDs in displaCy's placeholder links: href="#">Q123456</a>. Wikidata Q-IDs
+# are ASCII, so re.ASCII keeps \d to [0-9] instead of every Unicode digit.
+_QID_LINK_RE = re.compile(r'href="#">(Q\d+)</a>', re.ASCII)
+_QID_LINK_REPLACEMENT = r'href="https://www.wikidata.org/wiki/\1" target="_blank">\1</a>'
+
+# Cyrillic block; every character cyrtranslit maps for the supported language
+# codes lies in it, so text without a match needs no transliteration.
+_CYRILLIC_RE = re.compile('[\u0400-\u04FF]')
+
+# Pipeline components whose output process_text_in_chunks never reads; only
+# doc.ents is consumed. tok2vec/transformer stay on because ner listens to them,
+# and the parser is only dropped when no entity_linker needs its sentences.
+_NER_UNUSED_PIPES = frozenset({
+    'tagger', 'morphologizer', 'lemmatizer', 'trainable_lemmatizer',
+    'attribute_ruler', 'textcat', 'textcat_multilabel',
+})
+
+# Components known not to read the output of the ones above. Anything else
+# (entity_ruler, span_ruler, a custom component) may match on POS/TAG/LEMMA/DEP,
+# so when one is present the pipeline runs in full.
+_NER_KNOWN_PIPES = _NER_UNUSED_PIPES | {
+    'tok2vec', 'transformer', 'senter', 'sentencizer', 'parser', 'ner', 'entity_linker',
+}
+
+# Page wrapper and separator used when merging chunk visualizations
+_MERGED_HTML_HEADER = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="utf-8">
+    <title>{title}</title>
+    <style>{style}</style>
+</head>
+<body>
+    <div class="entities" style="line-height: 2.5; direction: ltr">
+        """
+_MERGED_HTML_FOOTER = """
+    </div>
+</body>
+</html>
+"""
+_SECTION_BREAK_HTML = (
+    '<div style="margin: 20px 0; padding: 10px; '
+    'border-top: 2px solid #ddd; border-bottom: 2px solid #ddd; '
+    'text-align: center; color: #666; font-style: italic;">'
+    '--- Document Section Break ---</div>'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _latin_translation_table(lang_code: str) -> dict:
+    """
+    Build the str.translate table for one language code (memoized).
+    
+    cyrtranslit.to_latin maps one character at a time with no cross-character
+    context, so its single-character mapping applied through str.translate
+    gives the same output in one C-level pass. Multi-character keys (e.g.
+    Montenegrin accented С́) can never match in cyrtranslit's per-character
+    loop and are left out.
+    
+    Args:
+        lang_code: A cyrtranslit language code
+        
+    Returns:
+        Translation table mapping code points to their Latin replacements
+    """
+    language = cyrtranslit.mapping.TRANSLIT_DICT.get(lang_code.lower()) or {}
+    mapping = language.get('tolatin') or {}
+    return str.maketrans({key: value for key, value in mapping.items() if len(key) == 1})
+
 
 def transliterate_to_latin(text: str, lang_code: str = 'sr') -> str:
     """
@@ -87,7 +174,13 @@ def transliterate_to_latin(text: str, lang_code: str = 'sr') -> str:
             f"Supported codes: {', '.join(sorted(SUPPORTED_TRANSLITERATION_CODES))}"
         )
     
-    return cyrtranslit.to_latin(text, lang_code)
+    # Pure-ASCII or Latin-only text (e.g. already transliterated input) has
+    # nothing to convert; isascii() is a C-level scan, the regex covers
+    # non-ASCII Latin such as "Đoković".
+    if text.isascii() or not _CYRILLIC_RE.search(text):
+        return text
+    
+    return text.translate(_latin_translation_table(lang_code))
 
 
 def split_into_paragraphs(text: str) -> List[str]:
@@ -100,13 +193,63 @@ def split_into_paragraphs(text: str) -> List[str]:
     Returns:
         List of paragraph strings
     """
-    # Split on double newlines, handling various line ending styles
-    paragraphs = re.split(r'\n\s*\n+', text)
+    return list(_iter_paragraphs(text))
+
+
+def _iter_paragraphs(text: str) -> Iterator[str]:
+    """
+    Lazily yield the stripped, non-empty paragraphs of text.
     
-    # Filter out empty paragraphs and strip whitespace
-    paragraphs = [p.strip() for p in paragraphs if p.strip()]
+    Paragraphs are sliced one at a time between blank-line separators, so
+    the chunk packer never holds a full list of paragraphs next to the text.
     
-    return paragraphs
+    Args:
+        text: The input text to split
+        
+    Yields:
+        Paragraph strings in order
+    """
+    # A paragraph break needs at least two newlines; skip the regex otherwise.
+    # Probing for the second newline stops early, unlike counting all of them.
+    if text.find('\n', text.find('\n') + 1) < 0:
+        stripped = text.strip()
+        if stripped:
+            yield stripped
+        return
+    
+    # Split on double newlines, handling various line ending styles, and
+    # strip whitespace once per paragraph, dropping the empty ones
+    start = 0
+    for match in _PARAGRAPH_BREAK_RE.finditer(text):
+        paragraph = text[start:match.start()].strip()
+        if paragraph:
+            yield paragraph
+        start = match.end()
+    paragraph = text[start:].strip()
+    if paragraph:
+        yield paragraph
+
+
+def _iter_sentences(paragraph: str) -> Iterator[str]:
+    """
+    Lazily split a paragraph into sentences on '.', '!' or '?' followed by whitespace.
+    
+    The terminator stays with its sentence and the separating whitespace is
+    dropped, matching ``re.split(r'(?<=[.!?])\\s+', paragraph)``. Sentences
+    are sliced one at a time, so an oversized paragraph is never duplicated
+    into a full list of sentences.
+    
+    Args:
+        paragraph: The paragraph to split
+        
+    Yields:
+        Sentence strings in order
+    """
+    start = 0
+    for match in _SENTENCE_END_RE.finditer(paragraph):
+        yield paragraph[start:match.start() + 1]
+        start = match.end()
+    yield paragraph[start:]
 
 
 def chunk_text(text: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> List[str]:
@@ -137,28 +280,88 @@ def chunk_text(text: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> List[
     if len(text) <= max_chunk_size:
         return [text]
     
-    # Split into paragraphs
-    paragraphs = split_into_paragraphs(text)
+    # Return a fresh list so callers can't mutate the cached result
+    return list(_chunk_text_cached(text, max_chunk_size))
+
+
+def iter_chunks(text: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Lazily yield the same chunks as chunk_text, one at a time.
+    
+    Useful for very large documents where holding every chunk in memory next
+    to the source text is undesirable. Unlike chunk_text, results are not
+    cached.
     
-    chunks = []
+    Args:
+        text: The input text to chunk
+        max_chunk_size: Maximum size of each chunk in characters
+        
+    Yields:
+        Text chunks in document order
+        
+    Raises:
+        ValueError: If max_chunk_size is less than 100 characters
+    """
+    if max_chunk_size < 100:
+        raise ValueError("max_chunk_size must be at least 100 characters")
+    
+    if not text or not text.strip():
+        return
+    
+    if len(text) <= max_chunk_size:
+        yield text
+        return
+    
+    yield from _iter_packed_chunks(text, max_chunk_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _chunk_text_cached(text: str, max_chunk_size: int) -> Tuple[str, ...]:
+    """
+    Chunk text that is known to exceed max_chunk_size (memoized).
+    
+    Re-processing the same document (e.g. pressing "Process" again in the GUI)
+    skips the whole split-and-pack pass. Only the most recent document is
+    kept: the key pins the caller's text object and the cached chunks copy
+    its contents again, so each entry costs about twice the document's size.
+    
+    Args:
+        text: The input text to chunk
+        max_chunk_size: Maximum size of each chunk in characters
+        
+    Returns:
+        Tuple of text chunks
+    """
+    return tuple(_iter_packed_chunks(text, max_chunk_size))
+
+
+def _iter_packed_chunks(text: str, max_chunk_size: int) -> Iterator[str]:
+    """
+    Pack paragraphs, then sentences, then characters into chunks.
+    
+    Args:
+        text: The input text to chunk, known to exceed max_chunk_size
+        max_chunk_size: Maximum size of each chunk in characters
+        
+    Yields:
+        Text chunks in document order
+    """
     current_chunk = []
     current_size = 0
     
-    for paragraph in paragraphs:
+    for paragraph in _iter_paragraphs(text):
         paragraph_size = len(paragraph)
         
         # If single paragraph is too large, we need to split it
         if paragraph_size > max_chunk_size:
             # First, save any accumulated paragraphs
             if current_chunk:
-                chunks.append('\n\n'.join(current_chunk))
+                yield '\n\n'.join(current_chunk)
                 current_chunk = []
                 current_size = 0
             
             # Split large paragraph on sentence boundaries
-            sentences = re.split(r'(?<=[.!?])\s+', paragraph)
-            
-            for sentence in sentences:
+            for sentence in _iter_sentences(paragraph):
                 sentence_size = len(sentence)
                 
                 # If a single sentence is too large, split by characters
@@ -166,11 +369,11 @@ def chunk_text(text: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> List[
                     # Split into character chunks
                     for i in range(0, sentence_size, max_chunk_size):
                         chunk_part = sentence[i:i + max_chunk_size]
-                        chunks.append(chunk_part)
+                        yield chunk_part
                 elif current_size + sentence_size + 1 > max_chunk_size:
                     # Start new chunk
                     if current_chunk:
-                        chunks.append(' '.join(current_chunk))
+                        yield ' '.join(current_chunk)
                     current_chunk = [sentence]
                     current_size = sentence_size
                 else:
@@ -180,7 +383,7 @@ def chunk_text(text: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> List[
             
             # Save any remaining sentences
             if current_chunk:
-                chunks.append(' '.join(current_chunk))
+                yield ' '.join(current_chunk)
                 current_chunk = []
                 current_size = 0
                 
@@ -188,7 +391,7 @@ def chunk_text(text: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> List[
             # +2 for double newline separator
             # Save current chunk and start new one
             if current_chunk:
-                chunks.append('\n\n'.join(current_chunk))
+                yield '\n\n'.join(current_chunk)
             current_chunk = [paragraph]
             current_size = paragraph_size
         else:
@@ -198,9 +401,114 @@ def chunk_text(text: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> List[
     
     # Don't forget the last chunk
     if current_chunk:
-        chunks.append('\n\n'.join(current_chunk))
+        yield '\n\n'.join(current_chunk)
+
+
+def _extract_tag_content(html: str, open_tag: str, close_tag: str) -> Optional[str]:
+    """
+    Extract the content between the first ``open_tag...>`` and the next ``close_tag``.
+    
+    Equivalent to ``re.search(open_tag + r'[^>]*>(.*?)' + close_tag, html, re.DOTALL)``,
+    but locates the literal markers with ``str.find`` in C and slices once, so
+    only the enclosed content is copied out of the chunk.
     
-    return chunks
+    Args:
+        html: The HTML string to search
+        open_tag: Start of the opening tag, without the closing '>' (e.g. '<style')
+        close_tag: The closing tag (e.g. '</style>')
+        
+    Returns:
+        The enclosed content, or None if the tags were not found
+    """
+    start = html.find(open_tag)
+    if start < 0:
+        return None
+    start = html.find('>', start + len(open_tag))
+    if start < 0:
+        return None
+    end = html.find(close_tag, start + 1)
+    if end < 0:
+        return None
+    return html[start + 1:end]
+
+
+def _iter_merged_page(
+    contents: Iterable[Optional[str]],
+    count: int,
+    style: str,
+    title: str
+) -> Iterator[str]:
+    """
+    Yield a merged HTML page wrapping the given entity contents.
+    
+    Args:
+        contents: Inner HTML of each chunk's entities div, or None for a chunk
+                  that did not match the expected pattern
+        count: Number of items in contents
+        style: CSS for the page's <style> element
+        title: Title for the merged HTML document
+        
+    Yields:
+        Consecutive fragments of the merged HTML document
+    """
+    yield _MERGED_HTML_HEADER.format(title=title, style=style)
+    
+    last_index = count - 1
+    for i, content in enumerate(contents):
+        if content is not None:
+            yield content
+            # Add a visual separator between chunks if not the last one
+            if i < last_index:
+                yield _SECTION_BREAK_HTML
+        else:
+            # Log warning if chunk doesn't match expected pattern
+            warnings.warn(f"Chunk {i+1} doesn't match expected HTML pattern and will be skipped")
+    
+    yield _MERGED_HTML_FOOTER
+
+
+def _iter_entity_contents(html_chunks: Iterable[str]) -> Iterator[Optional[str]]:
+    """
+    Yield the inner HTML of each chunk's entities div (None if it is missing).
+    
+    Args:
+        html_chunks: displaCy HTML strings, full pages or bare entities divs
+        
+    Yields:
+        The entities content of each chunk, or None
+    """
+    for html_chunk in html_chunks:
+        yield _extract_tag_content(html_chunk, '<div class="entities"', '</div>')
+
+
+def _iter_merged_html(html_chunks: List[str], title: str) -> Iterator[str]:
+    """
+    Yield the merged HTML document for html_chunks piece by piece.
+    
+    Shared by merge_html_outputs and write_merged_html so the string and the
+    streaming outputs are byte-for-byte identical.
+    
+    Args:
+        html_chunks: Non-empty list of HTML strings to merge
+        title: Title for the merged HTML document
+        
+    Yields:
+        Consecutive fragments of the merged HTML document
+    """
+    # If only one chunk, return it as-is
+    if len(html_chunks) == 1:
+        yield html_chunks[0]
+        return
+    
+    # Extract the CSS and content from the first chunk
+    # displaCy HTML has a standard structure with <style> and <div> tags
+    
+    # Get the style from the first chunk (all chunks should have same style)
+    style_content = _extract_tag_content(html_chunks[0], '<style', '</style>') or ""
+    
+    yield from _iter_merged_page(
+        _iter_entity_contents(html_chunks), len(html_chunks), style_content, title
+    )
 
 
 def merge_html_outputs(html_chunks: List[str], title: str = "NER Output") -> str:
@@ -224,56 +532,29 @@ def merge_html_outputs(html_chunks: List[str], title: str = "NER Output") -> str
     if not html_chunks:
         raise ValueError("html_chunks cannot be empty")
     
-    # If only one chunk, return it as-is
-    if len(html_chunks) == 1:
-        return html_chunks[0]
-    
-    # Extract the CSS and content from the first chunk
-    # displaCy HTML has a standard structure with <style> and <div> tags
+    return ''.join(_iter_merged_html(html_chunks, title))
+
+
+def write_merged_html(html_chunks: List[str], file: TextIO, title: str = "NER Output") -> None:
+    """
+    Stream the merged HTML document for html_chunks into an open text file.
     
-    # Pattern to extract style section
-    style_pattern = r'<style[^>]*>(.*?)</style>'
-    # Pattern to extract the marked-up content
-    content_pattern = r'<div class="entities"[^>]*>(.*?)</div>'
+    Produces the same document as merge_html_outputs, but writes each chunk's
+    content as it is extracted instead of first building the full merged
+    string, so the merged document is never held in memory as a whole.
     
-    # Get the style from the first chunk (all chunks should have same style)
-    style_match = re.search(style_pattern, html_chunks[0], re.DOTALL)
-    style_content = style_match.group(1) if style_match else ""
-    
-    # Extract content from all chunks
-    all_content = []
-    for i, html_chunk in enumerate(html_chunks):
-        content_match = re.search(content_pattern, html_chunk, re.DOTALL)
-        if content_match:
-            content = content_match.group(1)
-            all_content.append(content)
-            # Add a visual separator between chunks if not the last one
-            if i < len(html_chunks) - 1:
-                all_content.append('<div style="margin: 20px 0; padding: 10px; '
-                                 'border-top: 2px solid #ddd; border-bottom: 2px solid #ddd; '
-                                 'text-align: center; color: #666; font-style: italic;">'
-                                 '--- Document Section Break ---</div>')
-        else:
-            # Log warning if chunk doesn't match expected pattern
-            warnings.warn(f"Chunk {i+1} doesn't match expected HTML pattern and will be skipped")
-    
-    # Build the merged HTML
-    merged_html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <title>{title}</title>
-    <style>{style_content}</style>
-</head>
-<body>
-    <div class="entities" style="line-height: 2.5; direction: ltr">
-        {''.join(all_content)}
-    </div>
-</body>
-</html>
-"""
+    Args:
+        html_chunks: List of HTML strings to merge
+        file: Text file object opened for writing
+        title: Title for the merged HTML document
+        
+    Raises:
+        ValueError: If html_chunks is empty
+    """
+    if not html_chunks:
+        raise ValueError("html_chunks cannot be empty")
     
-    return merged_html
+    file.writelines(_iter_merged_html(html_chunks, title))
 
 
 def add_wikidata_links(html: str, doc) -> str:
@@ -290,28 +571,69 @@ def add_wikidata_links(html: str, doc) -> str:
     Returns:
         Enhanced HTML string with Wikidata links
     """
-    # Pattern to find Q-IDs in placeholder links: href="#">Q123456</a>
-    # Replace href="#" with the actual Wikidata URL
-    pattern = r'href="#">(Q\d+)</a>'
+    # Replace href="#" with the actual Wikidata URL. The replacement template is
+    # expanded by the regex engine, so no Python callback runs per entity.
+    return _QID_LINK_RE.sub(_QID_LINK_REPLACEMENT, html)
+
+
+def _unused_pipe_names(nlp) -> List[str]:
+    """
+    Get the names of pipeline components that NER output does not depend on.
+    
+    Nothing is disabled if the pipeline contains a component outside
+    _NER_KNOWN_PIPES, e.g. an entity_ruler whose patterns use POS or LEMMA.
     
-    def replace_qid_link(match):
-        qid = match.group(1)
-        wikidata_url = f"https://www.wikidata.org/wiki/{qid}"
-        return f'href="{wikidata_url}" target="_blank">{qid}</a>'
+    Args:
+        nlp: spaCy language model instance
+        
+    Returns:
+        Names of components in nlp.pipe_names that can be disabled
+    """
+    pipe_names = getattr(nlp, 'pipe_names', [])
+    if any(name not in _NER_KNOWN_PIPES for name in pipe_names):
+        return []
+    unused = set(_NER_UNUSED_PIPES)
+    if 'entity_linker' not in pipe_names:
+        unused.add('parser')
+    return [name for name in pipe_names if name in unused]
+
+
+def _model_max_chunk_size(nlp) -> int:
+    """
+    Pick a chunk size suited to the loaded pipeline.
     
-    html = re.sub(pattern, replace_qid_link, html)
+    Starts from DEFAULT_MAX_CHUNK_SIZE and shrinks it to half of nlp.max_length
+    and, for transformer pipelines, to TRANSFORMER_MAX_CHUNK_SIZE, whose
+    memory use grows quickly with document length.
     
-    return html
+    Args:
+        nlp: spaCy language model instance
+        
+    Returns:
+        Maximum chunk size in characters (at least 100)
+    """
+    size = DEFAULT_MAX_CHUNK_SIZE
+    max_length = getattr(nlp, 'max_length', None)
+    if isinstance(max_length, int):
+        size = min(size, max_length // 2)
+    if any('transformer' in name for name in getattr(nlp, 'pipe_names', [])):
+        size = min(size, TRANSFORMER_MAX_CHUNK_SIZE)
+    return max(size, 100)
 
 
 def process_text_in_chunks(
     nlp,
     text: str,
-    max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE,
-    output_path: Optional[Path] = None,
+    max_chunk_size: Optional[int] = None,
+    output_path: Optional[Union[str, os.PathLike]] = None,
     progress_callback: Optional[Callable[[int, int], None]] = None,
     transliterate: bool = False,
-    transliterate_lang: str = 'sr'
+    transliterate_lang: str = 'sr',
+    batch_size: int = DEFAULT_PIPE_BATCH_SIZE,
+    n_process: int = 1,
+    disable: Optional[Iterable[str]] = None,
+    entities_as_tuples: bool = False,
+    progress_callback_every: int = 1
 ) -> Tuple[List, str, int]:
     """
     Process text in chunks using spaCy NLP pipeline and merge results.
@@ -319,7 +641,7 @@ def process_text_in_chunks(
     This is a convenience function that:
     1. Optionally transliterates Cyrillic text to Latin
     2. Chunks the input text
-    3. Processes each chunk with spaCy
+    3. Processes the chunks with spaCy in batches via nlp.pipe
     4. Generates HTML visualizations
     5. Merges the HTML outputs
     6. Optionally saves to a file
@@ -327,21 +649,44 @@ def process_text_in_chunks(
     Args:
         nlp: spaCy language model instance
         text: Input text to process
-        max_chunk_size: Maximum chunk size in characters
-        output_path: Optional path to save merged HTML output
-        progress_callback: Optional callback function(current_chunk, total_chunks) 
-                          called before processing each chunk
+        max_chunk_size: Maximum chunk size in characters. If None, it is derived
+                       from the pipeline (DEFAULT_MAX_CHUNK_SIZE, capped by
+                       nlp.max_length and for transformer pipelines)
+        output_path: Optional path (str or path-like) to save merged HTML output
+        progress_callback: Optional callback function(current_chunk, total_chunks)
+                          called after each chunk has been processed and
+                          rendered
         transliterate: If True, transliterate Cyrillic to Latin before processing
         transliterate_lang: Language code for transliteration (default: 'sr')
+        batch_size: Number of chunks nlp.pipe processes per batch (default: 8)
+        n_process: Number of processes nlp.pipe uses (default: 1, -1 for all
+                  CPUs). Ignored for fewer than MIN_CHUNKS_FOR_MULTIPROCESSING
+                  chunks, where worker startup outweighs the gain. Keep 1 for
+                  GPU pipelines.
+        disable: Pipeline components to skip. If None, components whose output
+                is unused (tagger, lemmatizer, ...) are skipped, unless the
+                pipeline has a rule-based or custom component that may read
+                them; pass () to run the full pipeline
+        entities_as_tuples: If True, return entities as (text, label, start_char,
+                           end_char) tuples instead of Span objects, so each
+                           chunk's Doc can be freed once it is rendered.
+                           Offsets are relative to the chunk.
+        progress_callback_every: Call progress_callback only as every Nth
+                                chunk finishes, and for the last one
+                                (default: 1, every chunk), for callers such
+                                as progress bars that do not need per-chunk
+                                updates
         
     Returns:
         Tuple of (all_entities, merged_html, num_chunks)
-        - all_entities: List of all entities found across all chunks
+        - all_entities: List of all entities found across all chunks (Spans,
+          or tuples if entities_as_tuples is True)
         - merged_html: Merged HTML visualization
         - num_chunks: Number of chunks created
         
     Raises:
-        ValueError: If nlp is None or text is empty
+        ValueError: If nlp is None, text is empty or progress_callback_every
+                    is less than 1
         ImportError: If transliterate=True but cyrtranslit is not installed
     """
     if nlp is None:
@@ -350,6 +695,9 @@ def process_text_in_chunks(
     if not text or not text.strip():
         raise ValueError("text cannot be empty")
     
+    if progress_callback_every < 1:
+        raise ValueError("progress_callback_every must be at least 1")
+    
     if not DISPLACY_AVAILABLE:
         raise ImportError("spacy.displacy is required for process_text_in_chunks. Please install spacy.")
     
@@ -358,39 +706,73 @@ def process_text_in_chunks(
         text = transliterate_to_latin(text, transliterate_lang)
     
     # Chunk the text
+    if max_chunk_size is None:
+        max_chunk_size = _model_max_chunk_size(nlp)
     chunks = chunk_text(text, max_chunk_size)
     
-    # Process each chunk
+    # Process the chunks in batches; nlp.pipe amortizes per-call overhead and
+    # minibatches the neural components, unlike calling nlp(chunk) in a loop
     all_entities = []
     html_outputs = []
     
-    for i, chunk in enumerate(chunks):
-        # Call progress callback if provided
-        if progress_callback:
-            progress_callback(i, len(chunks))
-        
-        # Process with spaCy
-        doc = nlp(chunk)
-        
-        # Collect entities
-        all_entities.extend(doc.ents)
+    if disable is None:
+        disable = _unused_pipe_names(nlp)
+    
+    # Each chunk is up to max_chunk_size characters, so workers pay off once
+    # there are a few of them; batches are then sized to give every worker work
+    if n_process != 1 and len(chunks) >= MIN_CHUNKS_FOR_MULTIPROCESSING:
+        workers = n_process if n_process > 0 else (os.cpu_count() or 1)
+        batch_size = min(batch_size, -(-len(chunks) // workers))
+    else:
+        n_process = 1
+    
+    # A single chunk is returned as displaCy's own page. With several chunks
+    # only the entities markup is kept, so skip rendering a page per chunk
+    page = len(chunks) == 1
+    
+    docs = nlp.pipe(
+        chunks,
+        batch_size=max(1, min(len(chunks), batch_size)),
+        n_process=n_process,
+        disable=list(disable)
+    )
+    
+    # nlp.pipe reads its input a whole batch ahead of the docs it yields, so
+    # progress is reported from this loop, once each chunk has been processed
+    last_index = len(chunks) - 1
+    for i, doc in enumerate(docs):
+        # Collect entities; Spans keep their whole Doc alive, tuples do not
+        if entities_as_tuples:
+            all_entities.extend(
+                (ent.text, ent.label_, ent.start_char, ent.end_char) for ent in doc.ents
+            )
+        else:
+            all_entities.extend(doc.ents)
         
         # Generate HTML for this chunk
-        # Use page=True to get the full HTML page (including wrapper)
-        html = displacy.render(doc, style="ent", page=True)
+        html = displacy.render(doc, style="ent", page=page)
         
         # Add Wikidata links for entities with Q-IDs
         html = add_wikidata_links(html, doc)
         
         html_outputs.append(html)
+        
+        if progress_callback and (i % progress_callback_every == 0 or i == last_index):
+            progress_callback(i, len(chunks))
     
-    # Merge HTML outputs
+    # Merge HTML outputs (a single chunk's page is returned unchanged)
     merged_html = merge_html_outputs(html_outputs, title="Chunked NER Output")
     
     # Save if output path provided
     if output_path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(merged_html)
+        # One stat in the common case where the directory already exists;
+        # os.makedirs alone would attempt a mkdir and then stat on failure
+        output_dir = os.path.dirname(os.fspath(output_path)) or '.'
+        if not os.path.isdir(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+        # Encode once and write bytes, bypassing the text layer's per-write
+        # transcoding; the 1 MiB buffer keeps the syscall count low
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            f.write(merged_html.encode("utf-8"))
     
     return all_entities, merged_html, len(chunks)
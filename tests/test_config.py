@@ -24,6 +24,9 @@ def test_config_constants_defined():
         OUTPUTS_DIR,
         MAX_FILE_SIZE,
         DEFAULT_MAX_CHUNK_SIZE,
+        TRANSFORMER_MAX_CHUNK_SIZE,
+        DEFAULT_PIPE_BATCH_SIZE,
+        MIN_CHUNKS_FOR_MULTIPROCESSING,
         SUPPORTED_TRANSLITERATION_CODES,
     )
     
@@ -51,6 +54,12 @@ def test_config_constants_defined():
     assert MAX_FILE_SIZE > 0
     assert isinstance(DEFAULT_MAX_CHUNK_SIZE, int)
     assert DEFAULT_MAX_CHUNK_SIZE > 0
+    assert isinstance(TRANSFORMER_MAX_CHUNK_SIZE, int)
+    assert 0 < TRANSFORMER_MAX_CHUNK_SIZE <= DEFAULT_MAX_CHUNK_SIZE
+    assert isinstance(DEFAULT_PIPE_BATCH_SIZE, int)
+    assert DEFAULT_PIPE_BATCH_SIZE > 0
+    assert isinstance(MIN_CHUNKS_FOR_MULTIPROCESSING, int)
+    assert MIN_CHUNKS_FOR_MULTIPROCESSING > 1
     
     # Test transliteration codes
     assert isinstance(SUPPORTED_TRANSLITERATION_CODES, set)
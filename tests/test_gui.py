@@ -12,26 +12,58 @@ import tkinter as tk
 import sys
 from pathlib import Path
 
-# Add the src directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add the src directory to the path (once, even when several test modules do this)
+SRC_DIR = str(Path(__file__).parent.parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
+import gui
 from gui import NERDemoGUI, ToolTip
 
 
-class TestNERDemoGUIInitialization(unittest.TestCase):
-    """Test NERDemoGUI initialization behavior."""
+# A single Tk root shared by every test in this module. Starting a Tcl
+# interpreter is by far the most expensive part of these tests, so it is done
+# once here and each test only clears the widgets it created.
+_ROOT = None
+
+
+def setUpModule():
+    """Create the shared Tk root."""
+    global _ROOT
+    _ROOT = tk.Tk()
+    _ROOT.withdraw()
+
+
+def tearDownModule():
+    """Destroy the shared Tk root."""
+    global _ROOT
+    try:
+        _ROOT.destroy()
+    except tk.TclError:
+        # Ignore errors if the window is already destroyed
+        pass
+    _ROOT = None
+
+
+class SharedRootTestCase(unittest.TestCase):
+    """Base class for tests that need a Tk root window."""
     
     def setUp(self):
         """Set up test fixtures."""
-        self.root = tk.Tk()
+        self.root = _ROOT
     
     def tearDown(self):
-        """Clean up after tests."""
-        try:
-            self.root.destroy()
-        except tk.TclError:
-            # Ignore errors if the window is already destroyed or not initialized
-            pass
+        """Clean up after tests by destroying all widgets created on the root."""
+        for child in self.root.winfo_children():
+            try:
+                child.destroy()
+            except tk.TclError:
+                # Ignore errors if the widget is already destroyed
+                pass
+
+
+class TestNERDemoGUIInitialization(SharedRootTestCase):
+    """Test NERDemoGUI initialization behavior."""
     
     @patch.object(NERDemoGUI, 'create_widgets')
     @patch.object(NERDemoGUI, 'check_models')
@@ -96,26 +128,14 @@ class TestNERDemoGUIInitialization(unittest.TestCase):
             self.assertIsNotNone(app.status_var)
             
             # Now check_models should be callable without AttributeError
-            with patch('gui.Path.iterdir', return_value=[]), \
-                 patch('gui.messagebox.showinfo'):
+            with patch.object(gui.Path, 'iterdir', return_value=[]), \
+                 patch.object(gui.messagebox, 'showinfo'):
                 app.check_models()  # Should not raise AttributeError
 
 
-class TestToolTip(unittest.TestCase):
+class TestToolTip(SharedRootTestCase):
     """Test ToolTip behavior, especially with mocked widgets."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.root = tk.Tk()
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        try:
-            self.root.destroy()
-        except tk.TclError:
-            # Ignore errors if root window is already destroyed
-            pass
-    
     def test_tooltip_with_real_widget(self):
         """Test that tooltip works with a real widget."""
         label = tk.Label(self.root, text="Test")
@@ -191,20 +211,22 @@ class TestToolTip(unittest.TestCase):
         tooltip.hide_tooltip()
 
 
-class TestNERDemoGUICheckModels(unittest.TestCase):
+class TestNERDemoGUICheckModels(SharedRootTestCase):
     """Test check_models functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.root = tk.Tk()
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        try:
-            self.root.destroy()
-        except tk.TclError:
-            # Ignore errors if the root window is already destroyed
-            pass
+    @staticmethod
+    def patch_empty_model_dirs():
+        """Patch Path so the models directory exists but is empty.
+        
+        A single patch.multiple replaces exists, iterdir and mkdir together
+        instead of three stacked patch() context managers.
+        """
+        return patch.multiple(
+            gui.Path,
+            exists=MagicMock(return_value=True),
+            iterdir=MagicMock(return_value=[]),
+            mkdir=MagicMock(),
+        )
     
     @patch.object(NERDemoGUI, 'create_widgets')
     def test_check_models_requires_model_combo(self, mock_create_widgets):
@@ -215,9 +237,7 @@ class TestNERDemoGUICheckModels(unittest.TestCase):
         self.assertIsNone(app.model_combo)
         
         # Set up mocks for Path operations
-        with patch('gui.Path.exists', return_value=True), \
-             patch('gui.Path.iterdir', return_value=[]), \
-             patch('gui.Path.mkdir'):
+        with self.patch_empty_model_dirs():
             
             # This should raise TypeError because model_combo is None
             # (can't do item assignment on None)
@@ -241,10 +261,8 @@ class TestNERDemoGUICheckModels(unittest.TestCase):
             self.assertIsNotNone(app.status_var)
             
             # Set up mocks for Path operations and messagebox
-            with patch('gui.Path.exists', return_value=True), \
-                 patch('gui.Path.iterdir', return_value=[]), \
-                 patch('gui.Path.mkdir'), \
-                 patch('gui.messagebox.showinfo'):
+            with self.patch_empty_model_dirs(), \
+                 patch.object(gui.messagebox, 'showinfo'):
                 
                 # This should work without raising AttributeError
                 app.check_models()
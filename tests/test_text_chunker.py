@@ -7,17 +7,15 @@ including paragraph-based chunking, HTML merging, and edge cases.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src directory to path
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
+from unittest.mock import patch
 
+# src/ is importable through pytest's pythonpath setting in pyproject.toml
 from text_chunker import (
     split_into_paragraphs,
     chunk_text,
+    iter_chunks,
     merge_html_outputs,
+    write_merged_html,
     process_text_in_chunks,
     transliterate_to_latin,
     add_wikidata_links,
@@ -26,46 +24,109 @@ from text_chunker import (
 )
 
 
+# Multi-chunk inputs shared by the process_text_in_chunks tests, built once
+_LARGE_TEST_TEXT = "\n\n".join(
+    ["Apple is headquartered in Cupertino. Microsoft has offices worldwide."] * 30
+)
+_NUMBERED_PARAGRAPHS_TEXT = "\n\n".join(
+    f"Paragraph number {i} with some words." for i in range(40)
+)
+
+# Stand-in for tests where input validation fails before the model is used
+_DUMMY_NLP = object()
+
+
+@pytest.fixture(scope="module")
+def spacy_mod():
+    """The spacy module, imported once; skips the test if spaCy is missing."""
+    return pytest.importorskip("spacy")
+
+
+@pytest.fixture(scope="module")
+def blank_nlp(spacy_mod):
+    """Blank English pipeline shared by tests that do not modify the pipeline."""
+    return spacy_mod.blank("en")
+
+
+@pytest.fixture(scope="module")
+def blank_sr(spacy_mod):
+    """Blank Serbian pipeline shared by tests that do not modify the pipeline."""
+    return spacy_mod.blank("sr")
+
+
+@pytest.fixture(scope="module")
+def rule_based_nlp(spacy_mod):
+    """Blank English pipeline with an entity ruler, built once per module.
+    
+    Lets process_text_in_chunks be tested end to end with real entities but
+    without a trained model. Tests must not modify the pipeline.
+    """
+    nlp = spacy_mod.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "ORG", "pattern": "Apple"},
+        {"label": "ORG", "pattern": "Microsoft"},
+        {"label": "GPE", "pattern": "Cupertino"},
+        {"label": "PER", "pattern": "Tesla"},
+    ])
+    return nlp
+
+
+@pytest.fixture(scope="module")
+def sample_html_chunk():
+    """Fixture providing a sample HTML chunk similar to displaCy output."""
+    return '''<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        .entities { line-height: 2.5; }
+        mark.entity { padding: 0.25em; }
+    </style>
+</head>
+<body>
+    <div class="entities" style="line-height: 2.5">
+        This is some <mark class="entity" style="background: #ddd;">entity</mark> text.
+    </div>
+</body>
+</html>'''
+
+
 class TestSplitIntoParagraphs:
     """Test suite for split_into_paragraphs function."""
     
-    def test_single_paragraph(self):
-        """Test splitting text with a single paragraph."""
-        text = "This is a single paragraph."
-        result = split_into_paragraphs(text)
-        assert len(result) == 1
-        assert result[0] == "This is a single paragraph."
+    @pytest.mark.parametrize("text,expected", [
+        pytest.param("This is a single paragraph.", ["This is a single paragraph."],
+                     id="single_paragraph"),
+        pytest.param("First paragraph.\n\nSecond paragraph.\n\nThird paragraph.",
+                     ["First paragraph.", "Second paragraph.", "Third paragraph."],
+                     id="multiple_paragraphs"),
+        pytest.param("Paragraph 1.\n\nParagraph 2.\n  \n\nParagraph 3.",
+                     ["Paragraph 1.", "Paragraph 2.", "Paragraph 3."],
+                     id="various_newline_styles"),
+        pytest.param("Para 1.\n\n\n\nPara 2.\n\n  \n\nPara 3.",
+                     ["Para 1.", "Para 2.", "Para 3."],
+                     id="empty_paragraphs_filtered"),
+        pytest.param("", [], id="empty_text"),
+        pytest.param("   \n\n   \n   ", [], id="whitespace_only"),
+    ])
+    def test_split(self, text, expected):
+        """Test paragraph splitting on blank lines, with empty paragraphs dropped."""
+        assert split_into_paragraphs(text) == expected
     
-    def test_multiple_paragraphs(self):
-        """Test splitting text with multiple paragraphs."""
-        text = "First paragraph.\n\nSecond paragraph.\n\nThird paragraph."
-        result = split_into_paragraphs(text)
-        assert len(result) == 3
-        assert result[0] == "First paragraph."
-        assert result[1] == "Second paragraph."
-        assert result[2] == "Third paragraph."
-    
-    def test_various_newline_styles(self):
-        """Test handling of various newline styles."""
-        text = "Paragraph 1.\n\nParagraph 2.\n  \n\nParagraph 3."
-        result = split_into_paragraphs(text)
-        assert len(result) == 3
-    
-    def test_empty_paragraphs_filtered(self):
-        """Test that empty paragraphs are filtered out."""
-        text = "Para 1.\n\n\n\nPara 2.\n\n  \n\nPara 3."
-        result = split_into_paragraphs(text)
-        assert len(result) == 3
+    def test_single_newline_not_a_break(self):
+        """Test that text with at most one newline stays one stripped paragraph."""
+        assert split_into_paragraphs("  Line one.\nLine two.  ") == ["Line one.\nLine two."]
+        assert split_into_paragraphs(" \n ") == []
     
-    def test_empty_text(self):
-        """Test with empty text."""
-        result = split_into_paragraphs("")
-        assert result == []
+    def test_whitespace_line_is_a_break(self):
+        """Test that a line holding only whitespace separates paragraphs."""
+        assert split_into_paragraphs("Para 1.\n \t\nPara 2.") == ["Para 1.", "Para 2."]
     
-    def test_whitespace_only(self):
-        """Test with whitespace-only text."""
-        result = split_into_paragraphs("   \n\n   \n   ")
-        assert result == []
+    def test_windows_line_endings(self):
+        """Test that CRLF blank lines separate paragraphs and are stripped."""
+        text = "Para 1.\r\nstill 1.\r\n\r\nPara 2.\r\n\r\n\r\nPara 3.\r\n"
+        result = split_into_paragraphs(text)
+        assert result == ["Para 1.\r\nstill 1.", "Para 2.", "Para 3."]
 
 
 class TestChunkText:
@@ -76,7 +137,7 @@ class TestChunkText:
         text = "This is a small text."
         result = chunk_text(text, max_chunk_size=1000)
         assert len(result) == 1
-        assert result[0] == text
+        assert result[0] is text  # Returned as-is, without a copy
     
     def test_exact_size_limit(self):
         """Test text exactly at size limit."""
@@ -113,6 +174,16 @@ class TestChunkText:
         for chunk in result:
             assert len(chunk) <= 550  # Small tolerance
     
+    def test_sentence_split_keeps_terminators(self):
+        """Test that sentence splitting keeps '.', '!' and '?' with their sentence."""
+        large_para = "Is it? Yes! It is.  " * 40
+        result = chunk_text(large_para, max_chunk_size=200)
+        
+        assert len(result) > 1
+        for chunk in result:
+            assert chunk == chunk.strip()
+            assert chunk.endswith((".", "!", "?"))
+    
     def test_multiple_paragraphs_multiple_chunks(self):
         """Test multiple paragraphs split into multiple chunks."""
         para = "A" * 400
@@ -141,29 +212,79 @@ class TestChunkText:
         text = "x" * (DEFAULT_MAX_CHUNK_SIZE + 1000)
         result = chunk_text(text)
         assert len(result) >= 2
+    
+    def test_repeated_input_returns_independent_lists(self):
+        """Test that repeated input is served from the cache as a fresh list."""
+        from text_chunker import _chunk_text_cached
+        _chunk_text_cached.cache_clear()
+        
+        text = "\n\n".join(["Repeated paragraph. " * 10] * 5)
+        first = chunk_text(text, max_chunk_size=300)
+        first.append("mutated")
+        second = chunk_text(text, max_chunk_size=300)
+        
+        assert _chunk_text_cached.cache_info().hits == 1
+        assert second is not first
+        assert second == first[:-1]
+    
+    def test_random_inputs_respect_size_and_content(self):
+        """Test chunk size and content invariants on seeded random inputs."""
+        import random
+        rng = random.Random(0)
+        alphabet = "ab .!?\n\n \t\rж"
+        
+        for _ in range(100):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 3000)))
+            max_chunk_size = rng.randint(100, 500)
+            result = chunk_text(text, max_chunk_size)
+            
+            assert all(0 < len(chunk) <= max_chunk_size for chunk in result)
+            # Only whitespace at chunk boundaries may be dropped
+            assert "".join("".join(result).split()) == "".join(text.split())
+    
+    def test_iter_chunks_matches_chunk_text(self):
+        """Test that iter_chunks lazily yields the same chunks as chunk_text."""
+        text = "\n\n".join(["Sentence one. Sentence two! " * 8] * 6 + ["x" * 700])
+        
+        chunks = iter_chunks(text, max_chunk_size=300)
+        
+        assert not isinstance(chunks, list)
+        assert list(chunks) == chunk_text(text, max_chunk_size=300)
+        assert list(iter_chunks("Short text.")) == ["Short text."]
+        assert list(iter_chunks("   ")) == []
+    
+    def test_iter_chunks_invalid_size_raises_error(self):
+        """Test that iter_chunks rejects chunk sizes below 100."""
+        with pytest.raises(ValueError, match="at least 100"):
+            list(iter_chunks("Some text", max_chunk_size=50))
+    
+    def test_paragraph_separators_normalized(self):
+        """Test that packed paragraphs are stripped and re-joined with a blank line."""
+        paragraphs = [f"  Paragraph {i} text.  " for i in range(20)]
+        text = "\n \t\n\n".join(paragraphs)
+        result = chunk_text(text, max_chunk_size=100)
+        
+        assert len(result) > 1
+        for chunk in result:
+            assert chunk == "\n\n".join(p.strip() for p in chunk.split("\n\n"))
+            assert "\t" not in chunk
+        assert "\n\n".join(result).split("\n\n") == [p.strip() for p in paragraphs]
+    
+    def test_single_blob_split_on_sentences(self):
+        """Test that text without paragraph breaks is packed sentence by sentence."""
+        text = "  " + "A short sentence here. " * 100 + " "
+        result = chunk_text(text, max_chunk_size=200)
+        
+        assert len(result) > 1
+        for i, chunk in enumerate(result):
+            assert len(chunk) <= 200, f"chunk {i} exceeds max_chunk_size"
+            assert chunk.endswith("."), f"chunk {i} does not end on a sentence"
+        assert " ".join(result) == text.strip()
 
 
 class TestMergeHTMLOutputs:
     """Test suite for merge_html_outputs function."""
     
-    @pytest.fixture
-    def sample_html_chunk(self):
-        """Fixture providing a sample HTML chunk similar to displaCy output."""
-        return '''<!DOCTYPE html>
-<html>
-<head>
-    <style>
-        .entities { line-height: 2.5; }
-        mark.entity { padding: 0.25em; }
-    </style>
-</head>
-<body>
-    <div class="entities" style="line-height: 2.5">
-        This is some <mark class="entity" style="background: #ddd;">entity</mark> text.
-    </div>
-</body>
-</html>'''
-    
     def test_single_chunk_returns_unchanged(self, sample_html_chunk):
         """Test that a single chunk is returned as-is."""
         result = merge_html_outputs([sample_html_chunk])
@@ -197,59 +318,102 @@ class TestMergeHTMLOutputs:
         chunks = [sample_html_chunk, sample_html_chunk]
         result = merge_html_outputs(chunks)
         assert "Document Section Break" in result
+    
+    def test_entity_content_extracted_verbatim(self, sample_html_chunk):
+        """Test that the entities div body is copied into the merged output unchanged."""
+        result = merge_html_outputs([sample_html_chunk, sample_html_chunk])
+        body = sample_html_chunk.split('<div class="entities" style="line-height: 2.5">')[1]
+        body = body.split('</div>')[0]
+        assert result.count(body) == 2
+    
+    def test_malformed_chunk_skipped_with_warning(self, sample_html_chunk):
+        """Test that a chunk without an entities div is skipped with a warning."""
+        chunks = [sample_html_chunk, "<html><body>No entities here</body></html>"]
+        with pytest.warns(UserWarning, match="Chunk 2 doesn't match expected HTML pattern"):
+            result = merge_html_outputs(chunks)
+        assert "No entities here" not in result
+    
+    def test_write_merged_html_matches_merge(self, sample_html_chunk):
+        """Test that streaming to a file produces the same document as merging."""
+        import io
+        chunks = [sample_html_chunk, sample_html_chunk, sample_html_chunk]
+        buffer = io.StringIO()
+        write_merged_html(chunks, buffer, title="Streamed")
+        assert buffer.getvalue() == merge_html_outputs(chunks, title="Streamed")
+    
+    @pytest.mark.parametrize("n_chunks", [2, 10, 50, 200])
+    def test_many_chunks_merged(self, sample_html_chunk, n_chunks):
+        """Test merging N chunks keeps every body once, in order."""
+        chunks = [sample_html_chunk.replace("entity</mark>", f"entity {i}</mark>")
+                  for i in range(n_chunks)]
+        result = merge_html_outputs(chunks)
+        assert result.count("Document Section Break") == n_chunks - 1
+        assert result.count("<style>") == 1
+        positions = [result.index(f"entity {i}</mark>") for i in range(n_chunks)]
+        assert positions == sorted(positions)
+    
+    def test_write_merged_html_empty_list_raises_error(self):
+        """Test that streaming an empty list raises ValueError."""
+        import io
+        with pytest.raises(ValueError, match="html_chunks cannot be empty"):
+            write_merged_html([], io.StringIO())
 
 
 class TestProcessTextInChunks:
     """Test suite for process_text_in_chunks function."""
     
-    def test_none_nlp_raises_error(self):
-        """Test that None nlp raises ValueError."""
-        with pytest.raises(ValueError, match="nlp model cannot be None"):
-            process_text_in_chunks(None, "Some text")
+    @pytest.mark.parametrize("nlp,text,match", [
+        pytest.param(None, "Some text", "nlp model cannot be None", id="none_nlp"),
+        pytest.param(_DUMMY_NLP, "", "text cannot be empty", id="empty_text"),
+        pytest.param(_DUMMY_NLP, "   \n\n   ", "text cannot be empty", id="whitespace_text"),
+    ])
+    def test_invalid_input_raises_error(self, nlp, text, match):
+        """Test that a missing model or empty text raises ValueError."""
+        with pytest.raises(ValueError, match=match):
+            process_text_in_chunks(nlp, text)
     
-    def test_empty_text_raises_error(self):
-        """Test that empty text raises ValueError."""
-        # Create a minimal mock that won't be called
-        class DummyNLP:
-            pass
+    def test_small_text_processing(self, rule_based_nlp, tmp_path):
+        """Test processing small text that fits in one chunk."""
+        output_path = tmp_path / "out" / "small.html"
         
-        with pytest.raises(ValueError, match="text cannot be empty"):
-            process_text_in_chunks(DummyNLP(), "")
-    
-    def test_whitespace_text_raises_error(self):
-        """Test that whitespace-only text raises ValueError."""
-        # Create a minimal mock that won't be called
-        class DummyNLP:
-            pass
+        entities, html, num_chunks = process_text_in_chunks(
+            rule_based_nlp,
+            "Apple is headquartered in Cupertino.",
+            output_path=output_path
+        )
         
-        with pytest.raises(ValueError, match="text cannot be empty"):
-            process_text_in_chunks(DummyNLP(), "   \n\n   ")
+        assert num_chunks == 1
+        assert [(e.text, e.label_) for e in entities] == [("Apple", "ORG"), ("Cupertino", "GPE")]
+        assert "Document Section Break" not in html
+        assert output_path.read_text(encoding="utf-8") == html
     
-    @pytest.mark.skip(reason="Requires actual spaCy model, tested in integration")
-    def test_small_text_processing(self):
-        """Test processing small text that fits in one chunk."""
-        # This test requires an actual spaCy model to work with displaCy
-        # It's better tested with integration tests that use real models
-        pass
-    
-    @pytest.mark.skip(reason="Requires actual spaCy model, tested in integration")
-    def test_large_text_chunking(self):
+    def test_large_text_chunking(self, rule_based_nlp):
         """Test processing large text that requires chunking."""
-        # This test requires an actual spaCy model to work with displaCy
-        # It's better tested with integration tests that use real models
-        pass
+        entities, html, num_chunks = process_text_in_chunks(
+            rule_based_nlp, _LARGE_TEST_TEXT, max_chunk_size=500
+        )
+        
+        assert num_chunks > 1
+        assert [e.text for e in entities] == ["Apple", "Cupertino", "Microsoft"] * 30
+        assert html.count("Document Section Break") == num_chunks - 1
+        assert html.count("Microsoft") == 30
+    
+    def test_all_chunks_go_through_one_pipe_call(self, rule_based_nlp):
+        """Test that chunks are batched through a single nlp.pipe call."""
+        with patch.object(rule_based_nlp, "pipe", wraps=rule_based_nlp.pipe) as pipe:
+            entities, _, num_chunks = process_text_in_chunks(
+                rule_based_nlp, _LARGE_TEST_TEXT, max_chunk_size=500
+            )
+        
+        assert num_chunks > 1
+        assert pipe.call_count == 1
+        assert len(entities) == 90
     
     @pytest.mark.skipif(not CYRTRANSLIT_AVAILABLE, reason="cyrtranslit not installed")
-    def test_transliteration_integration(self):
+    def test_transliteration_integration(self, blank_sr):
         """Test that transliterate parameter works in process_text_in_chunks."""
         # This test verifies the integration of transliteration in the chunking workflow
-        try:
-            import spacy
-        except ImportError:
-            pytest.skip("spaCy not installed")
-        
-        # Create a blank Serbian model
-        nlp = spacy.blank("sr")
+        nlp = blank_sr
         
         # Cyrillic text
         cyrillic_text = "Београд је главни град Србије."
@@ -279,15 +443,9 @@ class TestProcessTextInChunks:
         # (one contains Cyrillic, one contains Latin)
         assert html_with != html_without
     
-    def test_progress_callback_invoked(self):
+    def test_progress_callback_invoked(self, blank_nlp):
         """Test that progress_callback is called correctly for each chunk."""
-        try:
-            import spacy
-        except ImportError:
-            pytest.skip("spaCy not installed")
-        
-        # Create a blank model for testing
-        nlp = spacy.blank("en")
+        nlp = blank_nlp
         
         # Create text that will be split into multiple chunks
         text = "Test paragraph. " * 1000  # Create text large enough to be chunked
@@ -315,15 +473,9 @@ class TestProcessTextInChunks:
             assert current == i, f"Current should be {i}, got {current}"
             assert total == num_chunks, f"Total should be {num_chunks}, got {total}"
     
-    def test_progress_callback_none_works(self):
+    def test_progress_callback_none_works(self, blank_nlp):
         """Test that None progress_callback works without errors."""
-        try:
-            import spacy
-        except ImportError:
-            pytest.skip("spaCy not installed")
-        
-        # Create a blank model for testing
-        nlp = spacy.blank("en")
+        nlp = blank_nlp
         
         # Should work fine with no callback
         all_entities, html, num_chunks = process_text_in_chunks(
@@ -334,6 +486,191 @@ class TestProcessTextInChunks:
         
         assert html is not None
         assert num_chunks >= 1
+    
+    def test_output_file_written(self, tmp_path, blank_nlp):
+        """Test that merged HTML is saved to output_path, creating parent directories."""
+        nlp = blank_nlp
+        output_path = tmp_path / "nested" / "outputs" / "result.html"
+        
+        all_entities, html, num_chunks = process_text_in_chunks(
+            nlp,
+            "First paragraph.\n\nSecond paragraph.",
+            output_path=output_path
+        )
+        
+        assert output_path.exists()
+        assert output_path.read_bytes() == html.encode("utf-8")
+    
+    def test_progress_callback_with_batched_pipe(self, blank_nlp):
+        """Test that progress is reported once per chunk when chunks are batched."""
+        nlp = blank_nlp
+        text = _NUMBERED_PARAGRAPHS_TEXT
+        calls = []
+        
+        all_entities, html, num_chunks = process_text_in_chunks(
+            nlp,
+            text,
+            max_chunk_size=200,
+            progress_callback=lambda i, total: calls.append((i, total)),
+            batch_size=3
+        )
+        
+        assert num_chunks > 3
+        assert calls == [(i, num_chunks) for i in range(num_chunks)]
+        assert html.count("Document Section Break") == num_chunks - 1
+
+    def test_progress_callback_follows_processed_docs(self, blank_nlp):
+        """Test that each chunk is reported only after nlp.pipe has yielded its doc."""
+        events = []
+        
+        class RecordingNLP:
+            pipe_names = blank_nlp.pipe_names
+            
+            def pipe(self, texts, **kwargs):
+                for i, doc in enumerate(blank_nlp.pipe(texts, **kwargs)):
+                    events.append(("doc", i))
+                    yield doc
+        
+        _, _, num_chunks = process_text_in_chunks(
+            RecordingNLP(),
+            _NUMBERED_PARAGRAPHS_TEXT,
+            max_chunk_size=200,
+            progress_callback=lambda i, total: events.append(("progress", i)),
+            batch_size=3
+        )
+        
+        assert num_chunks > 3
+        expected = []
+        for i in range(num_chunks):
+            expected += [("doc", i), ("progress", i)]
+        assert events == expected
+    
+    def test_progress_callback_every_nth_chunk(self, blank_nlp):
+        """Test that progress_callback_every samples finished chunks and reports the last one."""
+        text = _NUMBERED_PARAGRAPHS_TEXT
+        docs_done = []
+        calls = []
+        
+        class CountingNLP:
+            pipe_names = blank_nlp.pipe_names
+            
+            def pipe(self, texts, **kwargs):
+                for doc in blank_nlp.pipe(texts, **kwargs):
+                    docs_done.append(doc)
+                    yield doc
+        
+        _, _, num_chunks = process_text_in_chunks(
+            CountingNLP(),
+            text,
+            max_chunk_size=200,
+            progress_callback=lambda i, total: calls.append((i, len(docs_done))),
+            progress_callback_every=3
+        )
+        
+        assert num_chunks > 3
+        sampled = [i for i in range(num_chunks) if i % 3 == 0 or i == num_chunks - 1]
+        # Each sampled chunk is reported right after its own doc is yielded
+        assert calls == [(i, i + 1) for i in sampled]
+        
+        with pytest.raises(ValueError, match="progress_callback_every"):
+            process_text_in_chunks(blank_nlp, text, progress_callback_every=0)
+    
+    def test_unused_components_disabled(self, spacy_mod):
+        """Test that components whose output is not used are skipped."""
+        spacy = spacy_mod
+        from spacy.language import Language
+        
+        calls = []
+        
+        @Language.component("test_chunker_counting_tagger")
+        def counting_tagger(doc):
+            calls.append(doc.text)
+            return doc
+        
+        nlp = spacy.blank("en")
+        nlp.add_pipe("test_chunker_counting_tagger", name="tagger")
+        
+        process_text_in_chunks(nlp, "Some text.")
+        assert calls == []
+        
+        process_text_in_chunks(nlp, "Some text.", disable=())
+        assert calls == ["Some text."]
+    
+    def test_entity_ruler_keeps_attribute_components(self, spacy_mod):
+        """Test that components feeding POS/LEMMA to an entity_ruler stay enabled."""
+        nlp = spacy_mod.blank("en")
+        attribute_ruler = nlp.add_pipe("attribute_ruler")
+        attribute_ruler.add(
+            patterns=[[{"ORTH": "Tesla"}]], attrs={"POS": "PROPN", "LEMMA": "tesla"}
+        )
+        ruler = nlp.add_pipe("entity_ruler")
+        ruler.add_patterns([
+            {"label": "PER", "pattern": [{"LEMMA": "tesla", "POS": "PROPN"}]},
+        ])
+        
+        entities, _, _ = process_text_in_chunks(nlp, "Tesla was born in 1856.")
+        
+        assert [(e.text, e.label_) for e in entities] == [("Tesla", "PER")]
+    
+    def test_few_chunks_run_in_process(self, blank_nlp):
+        """Test that n_process is only forwarded when there are enough chunks."""
+        class RecordingNLP:
+            def __init__(self):
+                self.nlp = blank_nlp
+                self.pipe_names = self.nlp.pipe_names
+                self.pipe_kwargs = None
+            
+            def pipe(self, texts, **kwargs):
+                self.pipe_kwargs = kwargs
+                return self.nlp.pipe(texts)
+        
+        nlp = RecordingNLP()
+        process_text_in_chunks(nlp, "A single chunk.", n_process=4)
+        assert nlp.pipe_kwargs["n_process"] == 1
+        
+        text = _NUMBERED_PARAGRAPHS_TEXT
+        _, _, num_chunks = process_text_in_chunks(nlp, text, max_chunk_size=200, n_process=2)
+        assert num_chunks >= 4
+        assert nlp.pipe_kwargs["n_process"] == 2
+        assert nlp.pipe_kwargs["batch_size"] == min(8, -(-num_chunks // 2))
+    
+    def test_rule_based_pipeline_disable(self, rule_based_nlp):
+        """Test that disable= is forwarded to nlp.pipe for the rule-based pipeline."""
+        # Only the tokenizer and the ruler run; nothing else is skipped by default
+        assert rule_based_nlp.pipe_names == ["entity_ruler"]
+        text = "Apple is headquartered in Cupertino."
+        
+        entities, _, _ = process_text_in_chunks(rule_based_nlp, text)
+        assert len(entities) == 2
+        
+        disabled, _, _ = process_text_in_chunks(rule_based_nlp, text, disable=["entity_ruler"])
+        assert disabled == []
+        assert rule_based_nlp.pipe_names == ["entity_ruler"]
+    
+    def test_entities_as_tuples(self, rule_based_nlp):
+        """Test that entities can be returned as plain tuples instead of Spans."""
+        nlp = rule_based_nlp
+        
+        spans, _, _ = process_text_in_chunks(nlp, "Tesla was born in 1856.")
+        tuples, _, _ = process_text_in_chunks(
+            nlp, "Tesla was born in 1856.", entities_as_tuples=True
+        )
+        
+        assert tuples == [("Tesla", "PER", 0, 5)]
+        assert [(e.text, e.label_, e.start_char, e.end_char) for e in spans] == tuples
+    
+    def test_chunk_size_follows_model_max_length(self, spacy_mod):
+        """Test that the default chunk size is capped by nlp.max_length."""
+        spacy = spacy_mod
+        
+        nlp = spacy.blank("en")
+        nlp.max_length = 1000
+        text = "\n\n".join(f"Paragraph number {i} with some words." for i in range(60))
+        
+        _, _, derived_chunks = process_text_in_chunks(nlp, text)
+        _, _, explicit_chunks = process_text_in_chunks(nlp, text, max_chunk_size=500)
+        
+        assert derived_chunks == explicit_chunks == len(chunk_text(text, 500))
 
 
 class TestEdgeCases:
@@ -395,7 +732,13 @@ class TestTransliteration:
         latin_text = "Beograd"
         result = transliterate_to_latin(latin_text, 'sr')
         assert result == "Beograd"
-    
+
+    @pytest.mark.skipif(not CYRTRANSLIT_AVAILABLE, reason="cyrtranslit not installed")
+    def test_text_without_cyrillic_returned_as_is(self):
+        """Test that ASCII and non-ASCII Latin text skip transliteration."""
+        for text in ("Novak Djokovic, 2024.", "Novak Đoković, Šabac"):
+            assert transliterate_to_latin(text, 'sr') is text
+
     @pytest.mark.skipif(not CYRTRANSLIT_AVAILABLE, reason="cyrtranslit not installed")
     def test_mixed_cyrillic_latin(self):
         """Test mixed Cyrillic and Latin text."""
@@ -455,7 +798,19 @@ class TestTransliteration:
         # Numbers should be preserved
         assert "123" in result
         assert "2024" in result
-    
+
+    @pytest.mark.skipif(not CYRTRANSLIT_AVAILABLE, reason="cyrtranslit not installed")
+    def test_matches_cyrtranslit_output(self):
+        """Test that the translation table reproduces cyrtranslit.to_latin exactly."""
+        import cyrtranslit
+        text = "  Београд\tи\nБеоград,\r\n\nи  Нови Сад.  "
+        result = transliterate_to_latin(text, 'sr')
+        assert result == "  Beograd\ti\nBeograd,\r\n\ni  Novi Sad.  "
+        
+        samples = "Ђорђе Љубо Њушка Џеп Ћуприја Шабац Жабљак Съезд Ёлка Ѓорѓи Ќерка Ѕвезда Щука Єва"
+        for lang_code in ('sr', 'me', 'mk', 'ru', 'uk', 'kk', 'bg'):
+            assert transliterate_to_latin(samples, lang_code) == cyrtranslit.to_latin(samples, lang_code)
+
     @pytest.mark.skipif(not CYRTRANSLIT_AVAILABLE, reason="cyrtranslit not installed")
     def test_unsupported_language_code_raises_error(self):
         """Test that unsupported language codes raise ValueError."""
@@ -474,7 +829,7 @@ class TestTransliteration:
 class TestAddWikidataLinks:
     """Test suite for add_wikidata_links function."""
     
-    def test_adds_wikidata_links_for_qids(self):
+    def test_adds_wikidata_links_for_qids(self, blank_nlp):
         """Test that Wikidata links are added for Q-IDs in placeholder links."""
         # Create mock HTML with placeholder links
         html = '''<div class="entities">
@@ -487,12 +842,7 @@ class TestAddWikidataLinks:
 </div>'''
         
         # Create a mock doc with entities
-        try:
-            import spacy
-            nlp = spacy.blank("en")
-            doc = nlp("National Bank of Serbia")
-        except ImportError:
-            pytest.skip("spaCy not installed")
+        doc = blank_nlp("National Bank of Serbia")
         
         # Call the function
         result = add_wikidata_links(html, doc)
@@ -502,7 +852,7 @@ class TestAddWikidataLinks:
         assert 'target="_blank"' in result
         assert 'href="#">Q1194664</a>' not in result
     
-    def test_handles_multiple_qids(self):
+    def test_handles_multiple_qids(self, blank_nlp):
         """Test handling multiple Q-IDs in the same HTML."""
         html = '''<div class="entities">
 <mark class="entity">
@@ -518,12 +868,7 @@ class TestAddWikidataLinks:
 </mark>
 </div>'''
         
-        try:
-            import spacy
-            nlp = spacy.blank("en")
-            doc = nlp("Test")
-        except ImportError:
-            pytest.skip("spaCy not installed")
+        doc = blank_nlp("Test")
         
         result = add_wikidata_links(html, doc)
         
@@ -533,7 +878,18 @@ class TestAddWikidataLinks:
         assert 'href="https://www.wikidata.org/wiki/Q403"' in result
         assert 'href="#">Q' not in result
     
-    def test_preserves_nil_entries(self):
+    def test_handles_repeated_qids(self, blank_nlp):
+        """Test that every occurrence of a repeated Q-ID is linked in one pass."""
+        html = '<div class="entities">' + '<a href="#">Q3711</a> ' * 50 + '</div>'
+        
+        doc = blank_nlp("Test")
+        
+        result = add_wikidata_links(html, doc)
+        
+        assert result.count('href="https://www.wikidata.org/wiki/Q3711" target="_blank">Q3711</a>') == 50
+        assert 'href="#"' not in result
+    
+    def test_preserves_nil_entries(self, blank_nlp):
         """Test that NIL entries are preserved unchanged."""
         html = '''<div class="entities">
 <mark class="entity">
@@ -541,12 +897,7 @@ class TestAddWikidataLinks:
 </mark>
 </div>'''
         
-        try:
-            import spacy
-            nlp = spacy.blank("en")
-            doc = nlp("Test")
-        except ImportError:
-            pytest.skip("spaCy not installed")
+        doc = blank_nlp("Test")
         
         result = add_wikidata_links(html, doc)
         
@@ -554,21 +905,16 @@ class TestAddWikidataLinks:
         assert '<a href="#">NIL</a>' in result
         assert 'wikidata.org' not in result
     
-    def test_empty_entities_returns_unchanged(self):
+    def test_empty_entities_returns_unchanged(self, blank_nlp):
         """Test that HTML without entities is returned unchanged."""
         html = '<div class="entities">Plain text without entities</div>'
         
-        try:
-            import spacy
-            nlp = spacy.blank("en")
-            doc = nlp("Text")
-        except ImportError:
-            pytest.skip("spaCy not installed")
+        doc = blank_nlp("Text")
         
         result = add_wikidata_links(html, doc)
         assert result == html
     
-    def test_handles_different_qid_formats(self):
+    def test_handles_different_qid_formats(self, blank_nlp):
         """Test handling Q-IDs with different number lengths."""
         html = '''<div class="entities">
 <a href="#">Q1</a>
@@ -577,12 +923,7 @@ class TestAddWikidataLinks:
 <a href="#">Q123456789</a>
 </div>'''
         
-        try:
-            import spacy
-            nlp = spacy.blank("en")
-            doc = nlp("Test")
-        except ImportError:
-            pytest.skip("spaCy not installed")
+        doc = blank_nlp("Test")
         
         result = add_wikidata_links(html, doc)
         
@@ -593,7 +934,17 @@ class TestAddWikidataLinks:
         assert 'href="https://www.wikidata.org/wiki/Q123456789"' in result
         assert result.count('target="_blank"') == 4
     
-    def test_does_not_affect_other_links(self):
+    def test_ignores_non_ascii_digits(self, blank_nlp):
+        """Test that only ASCII-digit Q-IDs are linked."""
+        html = '<div class="entities"><a href="#">Q\u0661\u0662</a><a href="#">Q12</a></div>'
+        doc = blank_nlp("Test")
+        
+        result = add_wikidata_links(html, doc)
+        
+        assert '<a href="#">Q\u0661\u0662</a>' in result
+        assert 'href="https://www.wikidata.org/wiki/Q12"' in result
+    
+    def test_does_not_affect_other_links(self, blank_nlp):
         """Test that other links in the HTML are not affected."""
         html = '''<div class="entities">
 <a href="https://example.com">External Link</a>
@@ -601,12 +952,7 @@ class TestAddWikidataLinks:
 <a href="#">Q1194664</a>
 </div>'''
         
-        try:
-            import spacy
-            nlp = spacy.blank("en")
-            doc = nlp("Test")
-        except ImportError:
-            pytest.skip("spaCy not installed")
+        doc = blank_nlp("Test")
         
         result = add_wikidata_links(html, doc)
         
@@ -616,17 +962,13 @@ class TestAddWikidataLinks:
         # Only Q-ID link should be changed
         assert 'href="https://www.wikidata.org/wiki/Q1194664"' in result
     
-    def test_integration_with_displacy_output(self):
+    def test_integration_with_displacy_output(self, blank_nlp):
         """Test with actual displaCy HTML output structure."""
-        try:
-            import spacy
-            from spacy import displacy
-            from spacy.tokens import Span
-        except ImportError:
-            pytest.skip("spaCy not installed")
+        from spacy import displacy
+        from spacy.tokens import Span
         
         # Create a doc with an entity that has a Q-ID
-        nlp = spacy.blank("en")
+        nlp = blank_nlp
         doc = nlp("The National Bank of Serbia is in Belgrade.")
         
         # Create entities with Q-IDs